@@ -0,0 +1,47 @@
+"""
+Measures the startup cost of a synthesizer process: importing the components package, building and freezing the
+grammar, and the identifier lookups done by learn_dt.
+
+Usage: python benchmarks/startup.py [repeats]
+"""
+import os, subprocess, sys, timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from components import Grammar
+
+TERMS = ["0", "1", "x", "y", "T + T", "-T"]
+CONDITIONS = ["T <= T", "C and C", "not C"]
+
+
+def time_process(code:str, repeats:int) -> float:
+    """Returns the best wall time in ms of running the code in a fresh interpreter"""
+    best = float("inf")
+    for _ in range(repeats):
+        start = timeit.default_timer()
+        subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+        best = min(best, timeit.default_timer() - start)
+
+    return best * 1000
+
+
+def time_call(stmt, number:int) -> float:
+    """Returns the time in us of one call of stmt"""
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+if __name__ == "__main__":
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+    print("Process startup (best of %d, ms)" % repeats)
+    print(f"\tinterpreter only:         {time_process('pass', repeats):8.2f}")
+    print(f"\timport components:        {time_process('import components', repeats):8.2f}")
+    print(f"\tbuild frozen grammar:     {time_process(f'from components import Grammar; Grammar({TERMS}, {CONDITIONS}).freeze()', repeats):8.2f}")
+
+    grammar = Grammar(TERMS, CONDITIONS)
+    frozen = grammar.freeze()
+    print("Grammar calls (us per call)")
+    print(f"\tGrammar.identifiers:       {time_call(lambda: grammar.identifiers(as_list=True), 100000):8.3f}")
+    print(f"\tFrozenGrammar.identifiers: {time_call(lambda: frozen.identifiers(as_list=True), 100000):8.3f}")
+    print(f"\tGrammar.freeze:            {time_call(grammar.freeze, 10000):8.3f}")
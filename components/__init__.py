@@ -1,3 +1,22 @@
-from .grammar import Grammar
-from .specification import Specification
-from .decisiontree import DecisionTree
\ No newline at end of file
+from importlib import import_module as _import_module
+
+# exports are imported on first access so importing the package stays cheap
+_exports = {
+    "Grammar": ".grammar",
+    "FrozenGrammar": ".grammar",
+    "Specification": ".specification",
+    "DecisionTree": ".decisiontree",
+    "TermEvaluator": ".evaluator",
+}
+__all__ = list(_exports)
+
+def __getattr__(name:str):
+    if name not in _exports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(_import_module(_exports[name], __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_exports))
\ No newline at end of file
@@ -1,6 +1,7 @@
 from typing import Union
 from .dtnode import DTNode
 from .leafnode import LeafNode
+from ..utils import evaluate_predicate
 
 class InternalNode(DTNode):
     def __init__(self, predicate:str, true_branch:Union["InternalNode", LeafNode], false_branch:Union["InternalNode", "LeafNode"]):
@@ -31,5 +32,4 @@ class InternalNode(DTNode):
     
     def evaluate_predicate(self, params:list[str], pt:tuple):
         """"""
-        from ..utils import evaluate_predicate
         return evaluate_predicate(self.pred, params, pt)
\ No newline at end of file
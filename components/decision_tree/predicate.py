@@ -1,13 +1,14 @@
 class Predicate:
     def __init__(self, expr:str):
         self.str = expr
+        self.code = None
 
     def exec(self, params:list[str], args:int):
         """"""
         #print(f"\t\tpred: {self.str}, params: {params}, args: {args}")
-        scope = dict(zip(params, args))
-        exec(f"ret = {self.str}", scope)
-        return scope["ret"]
+        if self.code is None:
+            self.code = compile(self.str, "<predicate>", "eval") # compile once, predicates are evaluated on every pt
+        return eval(self.code, dict(zip(params, args)))
     
 
 def predicate_sort_key(s:str) -> tuple[int, str, str]:
@@ -0,0 +1,183 @@
+import ast
+from typing import Union
+from .internalnode import InternalNode
+from .leafnode import LeafNode
+from .predicate import Predicate
+
+# complement (not a op b == a comp b) and flip (a op b == b flip a) of comparison operators
+COMPLEMENT_OPS = {ast.Lt: ast.GtE, ast.LtE: ast.Gt, ast.Gt: ast.LtE, ast.GtE: ast.Lt, ast.Eq: ast.NotEq, ast.NotEq: ast.Eq}
+FLIPPED_OPS = {ast.Lt: ast.Gt, ast.LtE: ast.GtE, ast.Gt: ast.Lt, ast.GtE: ast.LtE, ast.Eq: ast.Eq, ast.NotEq: ast.NotEq}
+
+
+def simplify_tree(root:Union[InternalNode, LeafNode], params:list[str], pts:set=None) -> Union[InternalNode, LeafNode]:
+    """
+    Simplifies a decision tree without changing its output on the given pts
+
+    Splits implied by an ancestor's predicate are removed, as are splits that send every known pt down
+    the same branch. Nodes whose branches are identical are merged, `not` tests are flipped, nested
+    tests are folded into `and`/`or` chains, and the operands of those chains are ordered cheapest first.
+    """
+    return _simplify(root, params, pts, {})
+
+
+def tree_size(node:Union[InternalNode, LeafNode]) -> int:
+    """Returns the number of nodes in the tree rooted at node"""
+    if isinstance(node, LeafNode):
+        return 1
+
+    return 1 + tree_size(node.true_branch) + tree_size(node.false_branch)
+
+
+def tree_height(node:Union[InternalNode, LeafNode]) -> int:
+    """Returns the number of tests on the longest path from node to a leaf"""
+    if isinstance(node, LeafNode):
+        return 0
+
+    return 1 + max(tree_height(node.true_branch), tree_height(node.false_branch))
+
+
+def _simplify(node:Union[InternalNode, LeafNode], params:list[str], pts:Union[set, None], facts:dict[str, bool]):
+    """Recursive helper of simplify_tree, facts maps atomic tests decided by ancestors to their outcome"""
+    if isinstance(node, LeafNode):
+        return node
+
+    expr = _parse(node.pred.str)
+
+    # drop the split if ancestors already decide it
+    implied = _implied(expr, facts)
+    if implied is not None:
+        return _simplify(node.true_branch if implied else node.false_branch, params, pts, facts)
+
+    # drop the split if no known pt reaches one of its branches
+    pts_true, pts_false = None, None
+    if pts:
+        pts_true = {pt for pt in pts if node.pred.exec(params, pt)}
+        pts_false = pts - pts_true
+        if not pts_false:
+            return _simplify(node.true_branch, params, pts, facts)
+        if not pts_true:
+            return _simplify(node.false_branch, params, pts, facts)
+
+    facts_true, facts_false = facts.copy(), facts.copy()
+    _add_facts(expr, True, facts_true)
+    _add_facts(expr, False, facts_false)
+    true_branch = _simplify(node.true_branch, params, pts_true, facts_true)
+    false_branch = _simplify(node.false_branch, params, pts_false, facts_false)
+
+    # merge identical branches
+    if _same_tree(true_branch, false_branch):
+        return true_branch
+
+    # flip "not" tests
+    if isinstance(expr, ast.UnaryOp) and isinstance(expr.op, ast.Not):
+        expr = expr.operand
+        true_branch, false_branch = false_branch, true_branch
+
+    # fold chains, i.e. "if p: (if q: A else: B) else: B" becomes "if p and q: A else: B"
+    if isinstance(true_branch, InternalNode) and _same_tree(true_branch.false_branch, false_branch):
+        expr = _bool_op(ast.And(), expr, _parse(true_branch.pred.str))
+        true_branch = true_branch.true_branch
+    elif isinstance(false_branch, InternalNode) and _same_tree(false_branch.true_branch, true_branch):
+        expr = _bool_op(ast.Or(), expr, _parse(false_branch.pred.str))
+        false_branch = false_branch.false_branch
+
+    # evaluate the cheapest operands first
+    expr = _order_by_cost(expr)
+    pred_str = ast.unparse(expr)
+    pred = node.pred if pred_str == ast.unparse(_parse(node.pred.str)) else Predicate(pred_str)
+
+    return InternalNode(pred, true_branch, false_branch)
+
+
+def _parse(pred_str:str) -> ast.expr:
+    """Parses a predicate into an expression tree"""
+    return ast.parse(pred_str, mode="eval").body
+
+
+def _same_tree(a:Union[InternalNode, LeafNode], b:Union[InternalNode, LeafNode]) -> bool:
+    """Checks if two trees are structurally identical"""
+    if isinstance(a, LeafNode) or isinstance(b, LeafNode):
+        return isinstance(a, LeafNode) and isinstance(b, LeafNode) and a.value == b.value
+
+    return (a.pred.str == b.pred.str
+        and _same_tree(a.true_branch, b.true_branch)
+        and _same_tree(a.false_branch, b.false_branch))
+
+
+def _canonical(expr:ast.Compare) -> str:
+    """Returns a key shared by equivalent single comparisons (i.e. "x <= y" and "y >= x")"""
+    left, right = ast.unparse(expr.left), ast.unparse(expr.comparators[0])
+    op = type(expr.ops[0])
+    flipped = ast.unparse(ast.Compare(expr.comparators[0], [FLIPPED_OPS[op]()], [expr.left]))
+
+    return min(ast.unparse(expr), flipped) if left != right else ast.unparse(expr)
+
+
+def _is_simple_compare(expr:ast.expr) -> bool:
+    """Checks if the expression is a single comparison with a known complement"""
+    return isinstance(expr, ast.Compare) and len(expr.ops) == 1 and type(expr.ops[0]) in COMPLEMENT_OPS
+
+
+def _add_facts(expr:ast.expr, value:bool, facts:dict[str, bool]):
+    """Records what is known about atomic tests once expr is known to evaluate to value"""
+    if isinstance(expr, ast.UnaryOp) and isinstance(expr.op, ast.Not):
+        _add_facts(expr.operand, not value, facts)
+    elif isinstance(expr, ast.BoolOp):
+        # only "and" being true or "or" being false pins down every operand
+        if isinstance(expr.op, ast.And) == value:
+            for operand in expr.values:
+                _add_facts(operand, value, facts)
+    elif _is_simple_compare(expr):
+        complement = ast.Compare(expr.left, [COMPLEMENT_OPS[type(expr.ops[0])]()], expr.comparators)
+        facts[_canonical(expr)] = value
+        facts[_canonical(complement)] = not value
+    else:
+        facts[ast.unparse(expr)] = value
+
+
+def _implied(expr:ast.expr, facts:dict[str, bool]) -> Union[bool, None]:
+    """Returns the value of expr if the facts decide it, None otherwise"""
+    if isinstance(expr, ast.UnaryOp) and isinstance(expr.op, ast.Not):
+        value = _implied(expr.operand, facts)
+        return None if value is None else not value
+
+    if isinstance(expr, ast.BoolOp):
+        # "and" is decided by a false operand, "or" by a true one
+        deciding = not isinstance(expr.op, ast.And)
+        values = [_implied(operand, facts) for operand in expr.values]
+        if deciding in values:
+            return deciding
+        if all(value is not None for value in values):
+            return not deciding
+        return None
+
+    if _is_simple_compare(expr):
+        if ast.unparse(expr.left) == ast.unparse(expr.comparators[0]):
+            return isinstance(expr.ops[0], (ast.LtE, ast.GtE, ast.Eq))
+        return facts.get(_canonical(expr))
+
+    return facts.get(ast.unparse(expr))
+
+
+def _bool_op(op:ast.boolop, a:ast.expr, b:ast.expr) -> ast.BoolOp:
+    """Joins two expressions with op, flattening nested uses of the same operator"""
+    values = []
+    for expr in [a, b]:
+        if isinstance(expr, ast.BoolOp) and isinstance(expr.op, type(op)):
+            values.extend(expr.values)
+        else:
+            values.append(expr)
+
+    return ast.BoolOp(op, values)
+
+
+def _order_by_cost(expr:ast.expr) -> ast.expr:
+    """Orders the operands of "and"/"or" chains so the cheapest are evaluated first"""
+    if isinstance(expr, ast.BoolOp):
+        values = [_order_by_cost(value) for value in expr.values]
+        return ast.BoolOp(expr.op, sorted(values, key=lambda value: sum(1 for _ in ast.walk(value))))
+
+    if isinstance(expr, ast.UnaryOp):
+        return ast.UnaryOp(expr.op, _order_by_cost(expr.operand))
+
+    return expr
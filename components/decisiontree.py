@@ -2,6 +2,7 @@ from typing import Union, Callable
 from .decision_tree.leafnode import LeafNode
 from .decision_tree.internalnode import InternalNode
 from .decision_tree.predicate import Predicate
+from .decision_tree.simplify import simplify_tree, tree_size, tree_height
     
 class DecisionTree:
     def __init__(self, root:Union[LeafNode, InternalNode], params:list[int]):
@@ -26,6 +27,20 @@ class DecisionTree:
         """Prints code representation"""
         return self.root.__repr__()
 
+    def simplify(self, pts:set=None) -> dict[str, int]:
+        """
+        Simplifies the tree in place without changing its output on the given pts, see simplify_tree
+
+        Returns:
+            dict: the node count and depth of the tree before and after simplifying
+        """
+        stats = {"nodes_before": tree_size(self.root), "depth_before": tree_height(self.root)}
+        self.root = simplify_tree(self.root, self.params, pts)
+        self.root.set_depth()
+        stats.update({"nodes_after": tree_size(self.root), "depth_after": tree_height(self.root)})
+
+        return stats
+
     def decision_tree_to_func(self, func_name:str="my_func") -> Callable:
         """Returns a function representative of the decision tree"""
         local_scope = {}
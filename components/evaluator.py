@@ -0,0 +1,245 @@
+import ast
+from .grammar import Grammar
+from .specification import Specification
+
+np = None # NumPy, imported on first use since it's slow to import
+
+# values of int64 columns stay below this in magnitude, otherwise python ints are used instead
+INT64_SAFE_MAX = 2**63
+
+# operators numpy evaluates exactly like python on int64 (without overflow) and float64 columns
+INT_SAFE_OPS = (ast.Add, ast.Sub, ast.Mult, ast.USub, ast.UAdd)
+FLOAT_SAFE_OPS = INT_SAFE_OPS + (ast.Div,)
+
+
+def _import_numpy() -> bool:
+    """Imports NumPy into the module if it's available, returns whether it is"""
+    global np
+    if np is None:
+        try:
+            import numpy
+            np = numpy
+        except ImportError:
+            np = False
+
+    return np is not False
+
+
+class TermEvaluator:
+    def __init__(self, grammar:Grammar, specification:Specification):
+        """
+        Initiates an evaluator that computes which points a term covers
+
+        Points are stored column-major, one column per identifier of the grammar, so a term is evaluated on
+        every point with a single array expression. Terms or specifications that can't be evaluated on arrays
+        (or a missing NumPy) fall back to evaluating the term and the specification once per point.
+
+        The outputs of every term are kept in a term bank and only computed for points added since, and terms
+        with the same outputs share a cover, so cover checks of known terms are lookups, not re-executions.
+        Outputs are still computed on every point: whether a cover is distinct, and which term it's equivalent
+        to in M3, depends on all of them, so a term can't be rejected part way through.
+        """
+        self.grammar = grammar
+        self.specification = specification
+        self.identifiers = grammar.identifiers(as_list=True)
+        self.pts:list[tuple] = []
+        self.set_points(set())
+
+    def set_points(self, pts:set[tuple]):
+        """Stores the given points, one column per identifier, keeping the outputs computed for points already stored"""
+        if not set(self.pts).issubset(pts):
+            self.pts = []
+
+        if len(self.pts) == 0:
+            self.bank:dict[str, object] = dict() # term -> outputs on self.pts, as an array or a tuple
+            self.code:dict[str, object] = dict() # term -> compiled term
+            self.expectations:dict[tuple, tuple] = dict() # pt -> expected outputs and bounds
+            self.checked:dict[tuple, bool] = dict() # (pt, output type, output) -> specification holds
+        stored = set(self.pts)
+        self.pts = self.pts + [pt for pt in pts if pt not in stored]
+        self.covers:dict[object, set[tuple]] = dict() # key of outputs on self.pts -> cover
+        for pt in self.pts[len(stored):]:
+            self.expectations[pt] = self.specification.expectation(pt)
+        # numeric columns are int64 if every coordinate is an int, float64 if every coordinate is a float
+        self.columns, self.object_columns, self.column_type = None, None, None
+        if not self.pts or not _import_numpy():
+            return
+
+        array = np.asfortranarray(np.array(self.pts, dtype=object))
+        self.object_columns = dict(zip(self.identifiers, array.T))
+        types = {type(v) for pt in self.pts for v in pt}
+        if types == {int} and max(abs(v) for pt in self.pts for v in pt) < INT64_SAFE_MAX:
+            self.column_type = int
+            self.columns = {k: col.astype(np.int64) for k, col in self.object_columns.items()}
+            self.column_max = {k: max(abs(v) for v in col) for k, col in self.object_columns.items()}
+        elif types == {float}:
+            self.column_type = float
+            self.columns = {k: col.astype(np.float64) for k, col in self.object_columns.items()}
+
+    def outputs(self, term:str):
+        """
+        Returns the outputs of the term on the stored points, evaluating it only on points it hasn't seen
+
+        Returns:
+            numpy.ndarray: if the term was evaluated on the point columns with a numeric result
+            tuple: otherwise, the outputs as python objects
+        """
+        outputs = self.bank.get(term, ())
+        if len(outputs) < len(self.pts):
+            new_outputs = self._evaluate(term, len(outputs))
+            if isinstance(outputs, tuple) and len(outputs) == 0:
+                outputs = new_outputs
+            elif isinstance(outputs, tuple) or isinstance(new_outputs, tuple):
+                outputs = self._as_tuple(outputs) + self._as_tuple(new_outputs)
+            else:
+                outputs = np.concatenate([outputs, new_outputs])
+            self.bank[term] = outputs
+
+        return outputs
+
+    def cover(self, term:str) -> set[tuple]:
+        """Returns the set of stored points on which the term satisfies the specification"""
+        if not self.pts:
+            return set()
+
+        outputs = self.outputs(term)
+        key = self._outputs_key(outputs)
+        if key in self.covers:
+            return self.covers[key]
+
+        mask = self._cover_mask(outputs) if self.specification.vectorized and self.object_columns is not None else None
+        if mask is not None:
+            cover = {pt for pt, covered in zip(self.pts, mask) if covered}
+        else:
+            cover = self._cover_by_point(self._as_tuple(outputs))
+        if key is not None:
+            self.covers[key] = cover
+
+        return cover
+
+    def _outputs_key(self, outputs):
+        """
+        Returns a key identifying the outputs, which includes their types so that i.e. 1, 1.0 and True don't
+        share a cover, or None if the outputs aren't plain ints and floats
+        """
+        if not isinstance(outputs, tuple):
+            return (outputs.dtype.str, outputs.tobytes())
+
+        if all(type(output) in (int, float) for output in outputs):
+            return tuple((type(output), output) for output in outputs)
+
+        return None
+
+    def _as_tuple(self, outputs) -> tuple:
+        """Returns the outputs as a tuple of python objects"""
+        return outputs if isinstance(outputs, tuple) else tuple(outputs.tolist())
+
+    def _cover_by_point(self, outputs:tuple) -> set[tuple]:
+        """Checks the specification one point at a time, skipping the condition where the expected outputs rule it out"""
+        cover = set()
+        for pt, output in zip(self.pts, outputs):
+            if self.specification.rejects(output, pt, self.expectations[pt]):
+                continue
+
+            # only cache results of plain ints and floats, other outputs may be unhashable
+            if type(output) not in (int, float):
+                if self.specification.condition(output, *pt):
+                    cover.add(pt)
+                continue
+
+            key = (pt, type(output), output)
+            if key not in self.checked:
+                self.checked[key] = self.specification.condition(output, *pt)
+            if self.checked[key]:
+                cover.add(pt)
+
+        return cover
+
+    def _evaluate(self, term:str, start:int):
+        """Returns the outputs of the term on the stored points from index start onwards"""
+        if term not in self.code:
+            self.code[term] = compile(term, "<term>", "eval")
+        code = self.code[term]
+
+        if self.object_columns is not None:
+            outputs = self._evaluate_columns(term, code, start)
+            if outputs is not None:
+                return outputs
+
+        return tuple(eval(code, {}, dict(zip(self.identifiers, pt))) for pt in self.pts[start:])
+
+    def _evaluate_columns(self, term:str, code, start:int):
+        """
+        Evaluates the compiled term on the point columns from index start onwards, None if it can't be vectorized
+
+        The numeric columns are only used if numpy computes the term exactly like python would, otherwise the
+        term is evaluated on the python objects. Numeric results are returned as an array, others as a tuple
+        """
+        n = len(self.pts) - start
+        columns = self.columns if self._numeric_safe(ast.parse(term, mode="eval").body) else self.object_columns
+        columns = {k: col[start:] for k, col in columns.items()}
+        try:
+            with np.errstate(all="raise"):
+                output = eval(code, {}, columns)
+            # anything but arrays and numbers (i.e. lists) would be turned into arrays element by element
+            if not isinstance(output, np.ndarray) and type(output) not in (int, float, bool):
+                return None
+            output = np.broadcast_to(output, (n,))
+        except Exception:
+            return None
+
+        if output.dtype == object:
+            return tuple(output.tolist())
+
+        return np.ascontiguousarray(output)
+
+    def _numeric_safe(self, expr:ast.expr) -> bool:
+        """Checks if the term can be evaluated on the numeric columns without differing from python"""
+        if self.column_type is int:
+            bound = self._int_bound(expr)
+            return bound is not None and bound < INT64_SAFE_MAX
+
+        if self.column_type is float:
+            return all(isinstance(node, (ast.Name, ast.Load, ast.Constant, ast.BinOp, ast.UnaryOp) + FLOAT_SAFE_OPS)
+                and not (isinstance(node, ast.Constant) and type(node.value) not in (int, float))
+                for node in ast.walk(expr))
+
+        return False
+
+    def _int_bound(self, expr:ast.expr):
+        """
+        Returns a bound on the magnitude of every intermediate value of the term on the int columns, None if the
+        term uses anything other than identifiers, int constants, +, - and *
+        """
+        if isinstance(expr, ast.Name):
+            return self.column_max.get(expr.id)
+
+        if isinstance(expr, ast.Constant):
+            return abs(expr.value) if type(expr.value) is int else None
+
+        if isinstance(expr, ast.UnaryOp) and isinstance(expr.op, INT_SAFE_OPS):
+            return self._int_bound(expr.operand)
+
+        if isinstance(expr, ast.BinOp) and isinstance(expr.op, INT_SAFE_OPS):
+            left, right = self._int_bound(expr.left), self._int_bound(expr.right)
+            if left is None or right is None:
+                return None
+            return left * right if isinstance(expr.op, ast.Mult) else left + right
+
+        return None
+
+    def _cover_mask(self, outputs):
+        """Returns the cover of the outputs as a boolean array, or None if the specification can't be vectorized"""
+        n = len(self.pts)
+        try:
+            with np.errstate(all="raise"):
+                if isinstance(outputs, tuple):
+                    output, columns = np.array(outputs, dtype=object), self.object_columns
+                else:
+                    output, columns = outputs, self.columns if self.columns is not None else self.object_columns
+                mask = self.specification.condition(output, *[columns[k] for k in self.identifiers])
+                mask = np.broadcast_to(np.asarray(mask, dtype=bool), (n,))
+        except Exception:
+            return None
+
+        return mask
@@ -22,6 +22,21 @@ class Grammar:
         """Returns a list of base terms (aka non-recursive)"""
         return [term for term in self.terms if term.isdigit() or term.isidentifier()]
     
+    def term_templates(self) -> list[list[str]]:
+        """Returns the recursive terms split on their T placeholders"""
+        return [term.split("T") for term in self.terms if "T" in term]
+
+    def condition_templates(self, recursive:bool) -> list[list[str]]:
+        """Returns the (non-)recursive conditions split on their C (T) placeholders"""
+        if recursive:
+            return [condition.split("C") for condition in self.conditions if "C" in condition]
+
+        return [condition.split("T") for condition in self.conditions if "C" not in condition]
+
+    def freeze(self) -> "FrozenGrammar":
+        """Returns a frozen copy of the grammar with its derived data computed once"""
+        return FrozenGrammar(self.terms, self.conditions)
+
     def _make_str_from_parts_and_combination(self, parts:list[str], combination:tuple):
         """Substitutes combination into string, which is passed in parts"""
         string = "".join(p + (c if i < len(combination) else "")
@@ -32,9 +47,7 @@ class Grammar:
         """Enumerates predicates using the given terms"""
         # get non-recursive predicates
         predicates = set()
-        nr_conditions = [condition for condition in self.conditions if "C" not in condition]
-        for condition in nr_conditions:
-            parts = condition.split("T")
+        for parts in self.condition_templates(recursive=False):
             for combination in product(terms, repeat=len(parts) - 1):
                 # skip self comparisons
                 if any(combination[i] == combination[i + 1] for i in range(len(combination) - 1)):
@@ -44,9 +57,7 @@ class Grammar:
                 predicates.add(pred)
 
         # get recursive predicates
-        recursive_conditions = [condition for condition in self.conditions if "C" in condition]
-        for condition in recursive_conditions:
-            parts = condition.split("C")
+        for parts in self.condition_templates(recursive=True):
             for combination in product(predicates, repeat=len(parts) - 1):
                 # prune predicate
                 if len(parts) == 3 and self._prune_predicates(parts, combination):
@@ -105,10 +116,9 @@ class Grammar:
 
         # yield recursive terms
         seen_terms = set(self.non_recursive_terms())
-        recursive_terms = [term for term in self.terms if "T" in term] # like T+T
+        term_templates = self.term_templates() # like T+T
         while True:
-            for term in recursive_terms:
-                parts = term.split("T")
+            for parts in term_templates:
                 for combination in product(seen_terms, repeat=len(parts) - 1):
                     expr = self._make_str_from_parts_and_combination(parts, combination)
                     seen_terms.add(expr)
@@ -124,6 +134,51 @@ class Grammar:
         exec(func, {}, local_scope)
         return local_scope[func_name]
 
+
+class FrozenGrammar(Grammar):
+    def __init__(self, terms:list[str], conditions:list[str]):
+        """
+        Initialize an immutable grammar whose identifiers, base terms and production templates (the terms and
+        conditions split on their placeholders, not compiled code) are computed once
+        """
+        super().__init__(tuple(terms), tuple(conditions))
+        grammar = Grammar(self.terms, self.conditions)
+        self._identifiers = tuple(grammar.identifiers(as_list=True))
+        self._identifiers_str = grammar.identifiers()
+        self._non_recursive_terms = tuple(grammar.non_recursive_terms())
+        self._term_templates = tuple(tuple(parts) for parts in grammar.term_templates())
+        self._condition_templates = {
+            recursive: tuple(tuple(parts) for parts in grammar.condition_templates(recursive))
+            for recursive in [False, True]
+        }
+        self._frozen = True
+
+    def __setattr__(self, name:str, value):
+        if getattr(self, "_frozen", False):
+            raise AttributeError("FrozenGrammar is immutable")
+
+        super().__setattr__(name, value)
+
+    def identifiers(self, as_list:bool=False) -> Union[str, list[str]]:
+        """Returns a sorted list of identifiers from the grammar's terms"""
+        return list(self._identifiers) if as_list else self._identifiers_str
+
+    def non_recursive_terms(self) -> list[str]:
+        """Returns a list of base terms (aka non-recursive)"""
+        return list(self._non_recursive_terms)
+
+    def term_templates(self) -> tuple[tuple[str]]:
+        """Returns the recursive terms split on their T placeholders"""
+        return self._term_templates
+
+    def condition_templates(self, recursive:bool) -> tuple[tuple[str]]:
+        """Returns the (non-)recursive conditions split on their C (T) placeholders"""
+        return self._condition_templates[recursive]
+
+    def freeze(self) -> "FrozenGrammar":
+        """Returns the grammar itself, it's already frozen"""
+        return self
+
 # Example usage
 if __name__ == "__main__":
     grammar = Grammar(["T", "\nif C: \n\treturn T \nelse: \n\treturn T"], ["0", "1", "x", "y", "T + T"], ["T <= T", "C and C", "not C"])
@@ -1,14 +1,56 @@
-from typing import Callable
+from typing import Callable, Union
 
 class Specification:
-    def __init__(self, condition:Callable):
+    def __init__(self, condition:Callable, vectorized:bool=False, outputs:Callable=None, bounds:Callable=None):
         """
         Initiates an object of type specification with the given condition
 
         Parameters:
             condition (Callable): The condition used to check if a synthesized function satisfies the specification. It has syntax spec(output, *inputs) where output refers to the output of the synthesized function when it's passed the given inputs
+            vectorized (bool): Whether the condition also works elementwise on NumPy arrays of outputs and inputs (i.e. it's written with & and | instead of and and or, negating comparisons by flipping them rather than with not or ~, since ~ on the python bools holds() passes it is always truthy), which lets terms be checked on all points at once
+            outputs (Callable): Optional, has syntax outputs(*inputs) and returns the collection of outputs the condition can accept on the given inputs (i.e. lambda x, y: {x, y} when the output must equal one of the inputs)
+            bounds (Callable): Optional, has syntax bounds(*inputs) and returns a (low, high) tuple with the inclusive bounds an accepted output lies in, where None means unbounded
         """
         self.condition = condition
+        self.vectorized = vectorized
+        self.outputs = outputs
+        self.bounds = bounds
+
+    def expectation(self, inputs:tuple) -> tuple[Union[set, None], Union[tuple, None]]:
+        """Returns the accepted outputs and bounds on the given inputs, None for the ones that aren't specified"""
+        outputs = set(self.outputs(*inputs)) if self.outputs else None
+        bounds = self.bounds(*inputs) if self.bounds else None
+
+        return outputs, bounds
+
+    def rejects(self, output, inputs:tuple, expectation:tuple=None) -> bool:
+        """
+        Checks if the output is ruled out on the given inputs by the expected outputs alone, without evaluating the condition
+
+        Parameters:
+            output: The output of a synthesized function on the inputs
+            inputs (tuple): The inputs the output was computed with
+            expectation (tuple): The result of expectation(inputs), computed if not given
+
+        Returns:
+            bool: True if the condition can't hold, False if it has to be evaluated
+        """
+        if not self.outputs and not self.bounds:
+            return False
+
+        outputs, bounds = expectation if expectation is not None else self.expectation(inputs)
+        try:
+            if outputs is not None and output not in outputs:
+                return True
+
+            if bounds is not None:
+                low, high = bounds
+                return bool((low is not None and output < low) or (high is not None and output > high))
+        except TypeError:
+            # unhashable or incomparable outputs are left to the condition
+            return False
+
+        return False
 
     def holds(self, synthesized_func:Callable, inputs:tuple):
         """
@@ -23,7 +65,7 @@ class Specification:
         """
         #try:
         output = synthesized_func(*inputs)
-        return self.condition(output, *inputs)
+        return not self.rejects(output, inputs) and self.condition(output, *inputs)
         
         """except Exception as e:
             print(f"Error evaluating program, params:{inputs}, error:{e}")
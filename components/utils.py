@@ -1,5 +1,7 @@
-from typing import Callable
-from .decisiontree import DecisionTree
+from typing import Callable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .decisiontree import DecisionTree
     
 def predicate_sort_key(s:str) -> tuple[int, str, str]:
     """Sorts predicates: first by length, then letters, then numbers"""
@@ -16,7 +18,7 @@ def evaluate_predicate(predicate:str, params:list[str], args:tuple):
     return scope["ret"]
 
 
-def decision_tree_to_func(decision_tree:DecisionTree, params:list[int], func_name:str="my_func") -> Callable:
+def decision_tree_to_func(decision_tree:"DecisionTree", params:list[int], func_name:str="my_func") -> Callable:
     """Turns the given decision tree into a function"""
     local_scope = {}
     func = f"def {func_name}({params}): \n{decision_tree}"
@@ -1,4 +1,4 @@
-from components import Grammar, Specification, DecisionTree
+from components import Grammar, Specification, DecisionTree, TermEvaluator
 from components.decision_tree import LeafNode, InternalNode, Predicate
 from typing import Callable, Union, Generator
 import random, sys
@@ -20,11 +20,12 @@ class M3:
         to `True`, the function will print out more information to help with debugging or understanding the
         process. If `verbose` is set to `, defaults to False
         """
-        self.grammar = grammar
+        self.grammar = grammar.freeze()
         self.specification = specification
         self.name = name
         self.verbose = verbose
         self.pts:set[tuple] = set()
+        self.evaluator = TermEvaluator(self.grammar, specification)
 
     def synthesize(self, max_synth_iter:int=None, max_verify_checks:int=500) -> Callable:
         """
@@ -64,6 +65,7 @@ class M3:
             self.cover:dict[str, tuple] = dict()
             self.decision_tree = None
             self.terms_enumerated = self.grammar.enumerate_terms() # reset to first yield
+            self.evaluator.set_points(self.pts)
 
             # Term Solver - generates terms until all points are covered
             if self.verbose: print("\tTerm Solver:")
@@ -98,6 +100,14 @@ class M3:
                 elif self.verbose: 
                     print("\t\tDecision tree learning failed")
 
+            # Simplifier - removes redundant splits from the learned decision tree
+            stats = self.decision_tree.simplify(self.pts)
+            if self.verbose:
+                print(f"\tSimplifier:")
+                print(f"\t\tNodes: {stats['nodes_before']} -> {stats['nodes_after']}, Depth: {stats['depth_before']} -> {stats['depth_after']}")
+                if stats["nodes_after"] < stats["nodes_before"]:
+                    self.decision_tree.fprint("\t\t\t")
+
             # Verifier 
             # synthesize expresion from dt and verify
             if self.verbose: print(f"\tVerifying:")
@@ -206,6 +216,8 @@ class M3:
         learn the decision tree. The function then calls `learn_dt` with the initial parameters and returns the 
         resulting decision tree.
         """
+        params = self.grammar.identifiers(as_list=True)
+
         # recursive helper function to learn dt
         def learn_dt(pts:set, terms:set, cover:dict, preds:list[str]):
             # check if all points are covered by a single term
@@ -220,8 +232,8 @@ class M3:
             pred = Predicate(preds.pop()) # pick a predicate
 
             # get pts for each branch
-            pts_true = {pt for pt in pts if pred.exec(grammar.identifiers(as_list=True), pt)}
-            pts_false = {pt for pt in pts if not pred.exec(grammar.identifiers(as_list=True), pt)}
+            pts_true = {pt for pt in pts if pred.exec(params, pt)}
+            pts_false = pts - pts_true
 
             # build branches
             true_branch = learn_dt(pts_true, terms, cover, preds.copy())
@@ -232,7 +244,7 @@ class M3:
         
         # learn dt and return it
         root = learn_dt(self.pts, self.terms, self.cover, self.preds.copy())
-        return DecisionTree(root, self.grammar.identifiers(as_list=True))
+        return DecisionTree(root, params)
 
     def _next_distinct_term(self) -> str:
         """
@@ -249,8 +261,7 @@ class M3:
             if self.verbose: print(f"\t\tCandidate term={candidate_term}, ", end="")
 
             # check which points the term covers
-            term_as_func = self.grammar.code_to_func(f"\nreturn {candidate_term}", self.name)
-            t_cover = {pt for pt in self.pts if self.specification.holds(term_as_func, pt)} if self.pts else set()
+            t_cover = self.evaluator.cover(candidate_term)
             if self.verbose: print(f"term covers: {t_cover if t_cover else '{}'}, ", end="")
             
             # if term doesn't cover any points skip it
@@ -297,7 +308,7 @@ class M3:
         """
         args_num = len(self.grammar.identifiers(as_list=True))
         test_pts = self._generate_test_pts(args_num) 
-        synthesized_func = grammar.code_to_func("\n"+synthesized_expr)
+        synthesized_func = self.grammar.code_to_func("\n"+synthesized_expr)
 
         for check_i in range(max_checks):
             pt_i = next(test_pts)
@@ -312,8 +323,8 @@ if __name__ == "__main__":
     # Max
     print("\nMax Test")
     def spec_condition(output, x, y):
-        return output >= x and output >= y and (output == x or output == y)
-    spec = Specification(spec_condition)
+        return (output >= x) & (output >= y) & ((output == x) | (output == y))
+    spec = Specification(spec_condition, vectorized=True)
 
     terms = ["0", "1", "x", "y", "T + T"]
     conditions = ["T <= T", "C and C", "not C"]
@@ -326,8 +337,8 @@ if __name__ == "__main__":
     # Min
     print("\nMin Test")
     def spec_condition(output, x, y):
-        return output <= x and output <= y and (output == x or output == y)
-    spec = Specification(spec_condition)
+        return (output <= x) & (output <= y) & ((output == x) | (output == y))
+    spec = Specification(spec_condition, vectorized=True)
 
     terms = ["0", "1", "x", "y", "T + T"]
     conditions = ["T <= T", "C and C", "not C"]
@@ -342,7 +353,7 @@ if __name__ == "__main__":
     print("\nAbs Test")
     def spec_condition(output, x):
         return (x >= 0 and output == x) or (x < 0 and output == -x)
-    spec = Specification(spec_condition)
+    spec = Specification(spec_condition, outputs=lambda x: {x, -x}, bounds=lambda x: (0, None))
 
     terms = ["0", "1", "x", "T + T", "-T"]
     conditions = ["T <= T", "C and C", "not C"]
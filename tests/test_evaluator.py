@@ -0,0 +1,173 @@
+import random
+from itertools import islice
+from components import Grammar, Specification, TermEvaluator
+
+GRAMMAR = Grammar(["0", "1", "x", "y", "T + T", "T * T", "-T"], [])
+EXTRA_TERMS = ["(x * x) % y", "x // 3", "x / 2", "x ** 2", "x - y * y", "max(x, y)", "x if x > y else y", "x > y"]
+
+
+def max_condition(output, x, y):
+    return (output >= x) & (output >= y) & ((output == x) | (output == y))
+
+
+def max_condition_scalar(output, x, y):
+    return output >= x and output >= y and (output == x or output == y)
+
+
+def expected_cover(spec:Specification, term:str, pts:set) -> set:
+    """The cover as M3 computed it before the evaluator"""
+    term_as_func = GRAMMAR.code_to_func(f"\nreturn {term}")
+    return {pt for pt in pts if spec.holds(term_as_func, pt)}
+
+
+def terms() -> list[str]:
+    return list(islice(GRAMMAR.enumerate_terms(), 200)) + EXTRA_TERMS
+
+
+def check_covers(spec:Specification, pts:set):
+    evaluator = TermEvaluator(GRAMMAR, spec)
+    evaluator.set_points(pts)
+    for term in terms():
+        assert evaluator.cover(term) == expected_cover(spec, term, pts), term
+
+
+def random_pts(rng:random.Random, low, high, n:int=30) -> set:
+    """Random int points, without zeros so that terms like (x * x) % y are defined"""
+    pts = {(rng.randint(low, high), rng.randint(low, high)) for _ in range(n)} | {(3, 3)}
+    return {pt for pt in pts if 0 not in pt}
+
+
+def test_vectorized_spec_matches_per_point_holds():
+    rng = random.Random(0)
+    spec = Specification(max_condition, vectorized=True)
+    check_covers(spec, random_pts(rng, -20, 20))
+
+
+def test_scalar_spec_matches_per_point_holds():
+    rng = random.Random(1)
+    check_covers(Specification(max_condition_scalar), random_pts(rng, -20, 20))
+
+
+def test_vectorized_spec_using_and_falls_back():
+    rng = random.Random(2)
+    check_covers(Specification(max_condition_scalar, vectorized=True), random_pts(rng, -20, 20))
+
+
+def test_large_values_match_python_ints():
+    rng = random.Random(3)
+    spec = Specification(max_condition, vectorized=True)
+    for bound in [2**31, 2**61, 2**62, 2**63, 2**70]:
+        check_covers(spec, random_pts(rng, -bound, bound))
+
+
+def test_intermediate_overflow_uses_python_ints():
+    spec = Specification(max_condition, vectorized=True)
+    evaluator = TermEvaluator(GRAMMAR, spec)
+    evaluator.set_points({(2**40, 3), (5, 7)})
+
+    outputs = dict(zip(evaluator.pts, evaluator._as_tuple(evaluator.outputs("(x * x) % y"))))
+    assert outputs == {(2**40, 3): 1, (5, 7): 4}
+
+
+def test_float_points_are_not_truncated():
+    rng = random.Random(4)
+    spec = Specification(max_condition, vectorized=True)
+    pts = {(rng.uniform(-10, 10), rng.uniform(-10, 10)) for _ in range(30)} | {(2.5, 1.0)}
+    check_covers(spec, pts)
+
+    evaluator = TermEvaluator(GRAMMAR, spec)
+    evaluator.set_points({(2.5, 1.0)})
+    assert evaluator._as_tuple(evaluator.outputs("x")) == (2.5,)
+
+
+def test_mixed_int_and_float_points():
+    spec = Specification(max_condition, vectorized=True)
+    check_covers(spec, {(1, 2.5), (3, 3), (-2.0, 7), (4, 1)})
+
+
+def test_covers_stay_correct_as_points_grow_and_reset():
+    rng = random.Random(5)
+    spec = Specification(max_condition, vectorized=True)
+    evaluator = TermEvaluator(GRAMMAR, spec)
+    pts = set()
+    for bound in [10, 2**62, 2**70]:
+        pts |= random_pts(rng, -bound, bound, 10)
+        evaluator.set_points(pts)
+        for term in terms():
+            assert evaluator.cover(term) == expected_cover(spec, term, pts), term
+
+    pts = random_pts(rng, -10, 10, 10)
+    evaluator.set_points(pts)
+    for term in terms():
+        assert evaluator.cover(term) == expected_cover(spec, term, pts), term
+
+
+def counting_evaluator(spec:Specification) -> tuple[TermEvaluator, list]:
+    """Returns an evaluator that records the (term, start) of every term evaluation"""
+    evaluator = TermEvaluator(GRAMMAR, spec)
+    calls = []
+    evaluate = evaluator._evaluate
+    def counted(term, start):
+        calls.append((term, start))
+        return evaluate(term, start)
+    evaluator._evaluate = counted
+
+    return evaluator, calls
+
+
+def test_bank_reuses_outputs_when_points_grow():
+    for spec in [Specification(max_condition, vectorized=True), Specification(max_condition_scalar)]:
+        evaluator, calls = counting_evaluator(spec)
+        pts = {(1, 2), (5, 3)}
+        evaluator.set_points(pts)
+        evaluator.cover("x + y")
+        evaluator.cover("x + y")
+        assert calls == [("x + y", 0)]
+
+        pts = pts | {(4, 4), (-1, 7)}
+        evaluator.set_points(pts)
+        assert evaluator.cover("x + y") == expected_cover(spec, "x + y", pts)
+        assert calls == [("x + y", 0), ("x + y", 2)]
+        assert evaluator._as_tuple(evaluator.outputs("x + y")) == tuple(x + y for x, y in evaluator.pts)
+
+
+def test_bank_resets_when_points_shrink():
+    evaluator, calls = counting_evaluator(Specification(max_condition, vectorized=True))
+    evaluator.set_points({(1, 2), (5, 3), (4, 4)})
+    evaluator.cover("x")
+
+    evaluator.set_points({(1, 2), (7, 7)})
+    assert evaluator.cover("x") == {(7, 7)}
+    assert calls == [("x", 0), ("x", 0)]
+    assert evaluator.pts == [(1, 2), (7, 7)] or evaluator.pts == [(7, 7), (1, 2)]
+
+
+def test_terms_with_same_outputs_share_cover():
+    calls = []
+    def condition(output, x, y):
+        calls.append(output)
+        return max_condition_scalar(output, x, y)
+    evaluator = TermEvaluator(GRAMMAR, Specification(condition))
+    evaluator.set_points({(1, 2), (5, 3)})
+
+    assert evaluator.cover("x") == evaluator.cover("x + 0") == evaluator.cover("0 + x") == {(5, 3)}
+    assert len(calls) == 2
+
+
+def test_caches_tell_output_types_apart():
+    spec = Specification(lambda output, x: type(output) is int)
+    evaluator = TermEvaluator(Grammar(["x"], []), spec)
+    evaluator.set_points({(1,)})
+
+    assert evaluator.cover("x") == {(1,)}
+    assert evaluator.cover("x * 1.0") == set()
+    assert evaluator.cover("x == 1") == set()
+
+
+def test_unhashable_outputs():
+    spec = Specification(lambda output, x: output == [x], outputs=lambda x: {x})
+    evaluator = TermEvaluator(Grammar(["x"], []), spec)
+    evaluator.set_points({(1,), (2,)})
+
+    assert evaluator.cover("[x]") == {(1,), (2,)}
+    assert evaluator.cover("[1]") == {(1,)}
@@ -0,0 +1,53 @@
+import pickle
+import pytest
+from itertools import islice
+from components import Grammar, FrozenGrammar
+
+GRAMMARS = [
+    (["0", "1", "x", "y", "T + T"], ["T <= T", "C and C", "not C"]),
+    (["0", "1", "x", "T + T", "-T"], ["T <= T", "C and C", "not C"]),
+    (["y", "x", "z", "2", "T * T"], ["T < T", "C or C"]),
+]
+
+
+@pytest.mark.parametrize("terms, conditions", GRAMMARS)
+def test_frozen_grammar_matches_grammar(terms:list[str], conditions:list[str]):
+    grammar = Grammar(terms, conditions)
+    frozen = grammar.freeze()
+
+    assert isinstance(frozen, FrozenGrammar)
+    assert frozen.identifiers() == grammar.identifiers()
+    assert frozen.identifiers(as_list=True) == grammar.identifiers(as_list=True)
+    assert frozen.non_recursive_terms() == grammar.non_recursive_terms()
+    assert list(islice(frozen.enumerate_terms(), 300)) == list(islice(grammar.enumerate_terms(), 300))
+
+    base_terms = set(grammar.non_recursive_terms()[:3])
+    assert frozen.enumerate_predicates(base_terms) == grammar.enumerate_predicates(base_terms)
+
+
+def test_frozen_grammar_is_immutable():
+    frozen = Grammar(*GRAMMARS[0]).freeze()
+
+    with pytest.raises(AttributeError):
+        frozen.terms = ["x"]
+    with pytest.raises(AttributeError):
+        frozen._identifiers = ("z",)
+    assert frozen.freeze() is frozen
+
+    # callers changing the returned lists don't change the grammar
+    frozen.identifiers(as_list=True).append("z")
+    assert frozen.identifiers(as_list=True) == ["x", "y"]
+
+
+def test_frozen_grammar_pickles():
+    frozen = Grammar(*GRAMMARS[0]).freeze()
+    loaded = pickle.loads(pickle.dumps(frozen))
+
+    assert isinstance(loaded, FrozenGrammar)
+    assert loaded.identifiers() == frozen.identifiers()
+    assert loaded.non_recursive_terms() == frozen.non_recursive_terms()
+    assert loaded.term_templates() == frozen.term_templates()
+    assert loaded.condition_templates(True) == frozen.condition_templates(True)
+    assert list(islice(loaded.enumerate_terms(), 50)) == list(islice(frozen.enumerate_terms(), 50))
+    with pytest.raises(AttributeError):
+        loaded.terms = ["x"]
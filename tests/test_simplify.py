@@ -0,0 +1,78 @@
+import random
+from components import DecisionTree
+from components.decision_tree import InternalNode, LeafNode, Predicate
+
+PARAMS = ["x", "y"]
+
+
+def predict(node, pt:tuple) -> str:
+    """Returns the value of the leaf the pt reaches"""
+    while isinstance(node, InternalNode):
+        node = node.true_branch if node.pred.exec(PARAMS, pt) else node.false_branch
+
+    return node.value
+
+
+def random_pred(rng:random.Random, depth:int=0) -> str:
+    """Builds a random predicate over x, y and small constants"""
+    choice = rng.random()
+    if depth < 2 and choice < 0.2:
+        return f"not {random_pred(rng, depth + 1)}"
+    if depth < 2 and choice < 0.4:
+        return f"{random_pred(rng, depth + 1)} {rng.choice(['and', 'or'])} {random_pred(rng, depth + 1)}"
+
+    left, right = rng.sample(["x", "y", "0", "1", "x + y", "-x"], 2)
+    return f"{left} {rng.choice(['<=', '<', '>=', '>', '==', '!='])} {right}"
+
+
+def random_tree(rng:random.Random, depth:int):
+    """Builds a random tree with leaves a, b and c"""
+    if depth == 0 or rng.random() < 0.2:
+        return LeafNode(rng.choice("abc"))
+
+    return InternalNode(Predicate(random_pred(rng)), random_tree(rng, depth - 1), random_tree(rng, depth - 1))
+
+
+def test_removes_split_implied_by_ancestor():
+    tree = DecisionTree(InternalNode(Predicate("y >= x"),
+        InternalNode(Predicate("x <= y"), LeafNode("a"), LeafNode("b")), LeafNode("c")), PARAMS)
+    stats = tree.simplify()
+
+    assert repr(tree) == repr(DecisionTree(InternalNode(Predicate("y >= x"), LeafNode("a"), LeafNode("c")), PARAMS))
+    assert (stats["nodes_before"], stats["depth_before"], stats["nodes_after"], stats["depth_after"]) == (5, 2, 3, 1)
+
+
+def test_merges_identical_branches():
+    tree = DecisionTree(InternalNode(Predicate("x <= y"), LeafNode("a"), LeafNode("a")), PARAMS)
+    stats = tree.simplify()
+
+    assert isinstance(tree.root, LeafNode) and tree.root.value == "a"
+    assert (stats["nodes_after"], stats["depth_after"]) == (1, 0)
+
+
+def test_folds_nested_test_into_and():
+    tree = DecisionTree(InternalNode(Predicate("x <= y"),
+        InternalNode(Predicate("0 <= x"), LeafNode("a"), LeafNode("b")), LeafNode("b")), PARAMS)
+    tree.simplify()
+
+    assert tree.root.pred.str == "0 <= x and x <= y" # cheapest operand first
+    assert tree.root.true_branch.value == "a" and tree.root.false_branch.value == "b"
+
+
+def test_simplified_tree_matches_original():
+    rng = random.Random(0)
+    for _ in range(500):
+        root = random_tree(rng, 4)
+        pts = {(rng.randint(-5, 5), rng.randint(-5, 5)) for _ in range(20)}
+        expected = {pt: predict(root, pt) for pt in pts}
+
+        # symbolic simplifications alone keep the output on every pt
+        tree = DecisionTree(root, PARAMS)
+        tree.simplify()
+        assert {pt: predict(tree.root, pt) for pt in pts} == expected
+
+        # pruning with known pts keeps the output on those pts
+        tree = DecisionTree(root, PARAMS)
+        sample = set(rng.sample(sorted(pts), 10))
+        tree.simplify(sample)
+        assert all(predict(tree.root, pt) == expected[pt] for pt in sample)
@@ -0,0 +1,72 @@
+from components import Specification
+
+
+def max_condition(output, x, y):
+    return output >= x and output >= y and (output == x or output == y)
+
+
+def test_rejects_without_expectations():
+    spec = Specification(max_condition)
+
+    assert not spec.rejects(100, (1, 2))
+
+
+def test_rejects_with_outputs_only():
+    spec = Specification(max_condition, outputs=lambda x, y: {x, y})
+
+    assert spec.rejects(3, (1, 2))
+    assert not spec.rejects(1, (1, 2)) # allowed by the outputs, even though the condition fails
+    assert not spec.rejects(2, (1, 2))
+
+
+def test_rejects_with_bounds_only():
+    spec = Specification(max_condition, bounds=lambda x, y: (max(x, y), 10))
+
+    assert spec.rejects(1, (1, 2))
+    assert spec.rejects(11, (1, 2))
+    assert not spec.rejects(2, (1, 2))
+    assert not spec.rejects(10, (1, 2))
+
+
+def test_rejects_with_open_bounds():
+    low_only = Specification(max_condition, bounds=lambda x, y: (max(x, y), None))
+    high_only = Specification(max_condition, bounds=lambda x, y: (None, 0))
+
+    assert low_only.rejects(1, (1, 2)) and not low_only.rejects(10**30, (1, 2))
+    assert high_only.rejects(1, (1, 2)) and not high_only.rejects(-10**30, (1, 2))
+
+
+def test_rejects_with_outputs_and_bounds():
+    spec = Specification(max_condition, outputs=lambda x, y: {x, y}, bounds=lambda x, y: (max(x, y), None))
+
+    assert spec.rejects(3, (1, 2)) # out of the outputs
+    assert spec.rejects(1, (1, 2)) # below the bounds
+    assert not spec.rejects(2, (1, 2))
+
+
+def test_rejects_uses_given_expectation():
+    spec = Specification(max_condition, outputs=lambda x, y: {x, y})
+
+    assert spec.expectation((1, 2)) == ({1, 2}, None)
+    assert not spec.rejects(3, (1, 2), expectation=({3}, None))
+
+
+def test_rejects_leaves_unhashable_outputs_to_condition():
+    spec = Specification(max_condition, outputs=lambda x, y: {x, y}, bounds=lambda x, y: (0, None))
+
+    assert not spec.rejects([1], (1, 2))
+
+
+def test_holds_short_circuits_on_rejects():
+    calls = []
+    def condition(output, x, y):
+        calls.append(output)
+        return max_condition(output, x, y)
+    spec = Specification(condition, outputs=lambda x, y: {x, y})
+
+    assert not spec.holds(lambda x, y: x + y, (1, 2))
+    assert calls == []
+
+    assert spec.holds(lambda x, y: y, (1, 2))
+    assert not spec.holds(lambda x, y: x, (1, 2))
+    assert calls == [2, 1]